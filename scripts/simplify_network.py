@@ -421,8 +421,8 @@ def simplify_links(
             # TODO revise a variable name for `dc_edges` variable
             # `dc_edges` is a list containing dc-relevant graph elements like [('Line', '712308316-1_0')]
             all_dc_branches = [i for _, i in sum(dc_edges, [])]
-            all_links = list(set(n.links.index).intersection(all_dc_branches))
-            all_dc_lines = list(set(n.lines.index).intersection(all_dc_branches))
+            all_links = n.links.index.intersection(all_dc_branches)
+            all_dc_lines = n.lines.index.intersection(all_dc_branches)
 
             all_dc_lengths = pd.concat(
                 [n.links.loc[all_links, "length"], n.lines.loc[all_dc_lines, "length"]]
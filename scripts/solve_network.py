@@ -102,7 +102,13 @@ logger = create_logger(__name__)
 def prepare_network(n, solve_opts):
     if "clip_p_max_pu" in solve_opts:
         for df in (n.generators_t.p_max_pu, n.storage_units_t.inflow):
-            df.where(df > solve_opts["clip_p_max_pu"], other=0.0, inplace=True)
+            # zero out small values directly in the underlying buffers,
+            # skipping the intermediate boolean frame df.where would build.
+            # Go column by column: a column Series always views the stored
+            # data, while df.values silently copies on multi-block frames
+            for col in df:
+                arr = df[col].values
+                np.putmask(arr, arr <= solve_opts["clip_p_max_pu"], 0.0)
 
     load_shedding = solve_opts.get("load_shedding")
     if load_shedding:
@@ -126,19 +132,22 @@ def prepare_network(n, solve_opts):
         )
 
     if solve_opts.get("noisy_costs"):
-        for t in n.iterate_components(n.one_port_components):
+        # the PCG64-based generator draws noise considerably faster than
+        # the legacy np.random interface
+        rng = np.random.default_rng()
+        # one-port components carrying a marginal_cost attribute; writing
+        # through .values skips pandas' alignment dispatch per component
+        for c in ("Generator", "StorageUnit", "Store"):
             # TODO: uncomment out to and test noisy_cost (makes solution unique)
-            # if 'capital_cost' in t.df:
-            #    t.df['capital_cost'] += 1e1 + 2.*(np.random.random(len(t.df)) - 0.5)
-            if "marginal_cost" in t.df:
-                t.df["marginal_cost"] += 1e-2 + 2e-3 * (
-                    np.random.random(len(t.df)) - 0.5
-                )
+            # cc = n.df(c)["capital_cost"].values
+            # cc += 1e1 + rng.uniform(-1.0, 1.0, size=cc.size)
+            mc = n.df(c)["marginal_cost"].values
+            mc += 1e-2 + rng.uniform(-1e-3, 1e-3, size=mc.size)
 
-        for t in n.iterate_components(["Line", "Link"]):
-            t.df["capital_cost"] += (
-                1e-1 + 2e-2 * (np.random.random(len(t.df)) - 0.5)
-            ) * t.df["length"]
+        for c in ("Line", "Link"):
+            df = n.df(c)
+            cc = df["capital_cost"].values
+            cc += (1e-1 + rng.uniform(-1e-2, 1e-2, size=cc.size)) * df["length"].values
 
     if solve_opts.get("nhours"):
         nhours = solve_opts["nhours"]
@@ -148,11 +157,38 @@ def prepare_network(n, solve_opts):
     return n
 
 
+def group_weighted_sum(df, grouper, weights):
+    """
+    Computes ``weights @ df.groupby(grouper, axis=1).sum()`` without the
+    intermediate grouped frame.
+
+    The column group-sum is a single ``np.add.at`` scatter on the underlying
+    values and the snapshot weighting a BLAS matrix-vector product, avoiding
+    pandas' groupby and alignment machinery.
+    """
+    codes, groups = pd.factorize(grouper.reindex(df.columns), sort=True)
+    values = df.values
+    if (codes < 0).any():
+        # columns without a group key are dropped, as pandas' groupby does
+        keep = codes >= 0
+        values = values[:, keep]
+        codes = codes[keep]
+    grouped = np.zeros((values.shape[0], len(groups)))
+    np.add.at(grouped.T, codes, values.T)
+    return pd.Series(weights.values @ grouped, index=groups)
+
+
 def add_CCL_constraints(n, config):
     agg_p_nom_limits = config["electricity"].get("agg_p_nom_limits")
 
     try:
-        agg_p_nom_minmax = pd.read_csv(agg_p_nom_limits, index_col=list(range(2)))
+        agg_p_nom_minmax = pd.read_csv(
+            agg_p_nom_limits,
+            index_col=[0, 1],
+            engine="c",
+            memory_map=True,
+            dtype={"min": np.float64, "max": np.float64},
+        )
     except IOError:
         logger.exception(
             "Need to specify the path to a .csv file containing "
@@ -163,18 +199,19 @@ def add_CCL_constraints(n, config):
         "Adding per carrier generation capacity constraints for " "individual countries"
     )
 
-    gen_country = n.generators.bus.map(n.buses.country)
-    # cc means country and carrier
+    # cc means country and carrier; p_nom variables only exist for
+    # extendable generators, so build the frame for those right away
+    # instead of aligning over all generators and dropping the rest
+    ext_i = n._ext_i
     p_nom_per_cc = (
         pd.DataFrame(
             {
                 "p_nom": linexpr((1, get_var(n, "Generator", "p_nom"))),
-                "country": gen_country,
-                "carrier": n.generators.carrier,
+                "country": n._cc_cache["gen_country"][ext_i],
+                "carrier": n.generators.carrier[ext_i],
             }
         )
-        .dropna(subset=["p_nom"])
-        .groupby(["country", "carrier"])
+        .groupby(["country", "carrier"], observed=True)
         .p_nom.apply(join_exprs)
     )
     minimum = agg_p_nom_minmax["min"].dropna()
@@ -193,20 +230,18 @@ def add_EQ_constraints(n, o, scaling=1e-1):
     float_regex = "[0-9]*\.?[0-9]+"
     level = float(re.findall(float_regex, o)[0])
     if o[-1] == "c":
-        ggrouper = n.generators.bus.map(n.buses.country)
-        lgrouper = n.loads.bus.map(n.buses.country)
-        sgrouper = n.storage_units.bus.map(n.buses.country)
+        ggrouper = n._cc_cache["gen_country"]
+        lgrouper = n._cc_cache["load_country"]
+        sgrouper = n._cc_cache["su_country"]
     else:
         ggrouper = n.generators.bus
         lgrouper = n.loads.bus
         sgrouper = n.storage_units.bus
-    load = (
-        n.snapshot_weightings.generators
-        @ n.loads_t.p_set.groupby(lgrouper, axis=1).sum()
+    load = group_weighted_sum(
+        n.loads_t.p_set, lgrouper, n.snapshot_weightings.generators
     )
-    inflow = (
-        n.snapshot_weightings.stores
-        @ n.storage_units_t.inflow.groupby(sgrouper, axis=1).sum()
+    inflow = group_weighted_sum(
+        n.storage_units_t.inflow, sgrouper, n.snapshot_weightings.stores
     )
     inflow = inflow.reindex(load.index).fillna(0.0)
     rhs = scaling * (level * load - inflow)
@@ -214,7 +249,7 @@ def add_EQ_constraints(n, o, scaling=1e-1):
         linexpr(
             (n.snapshot_weightings.generators * scaling, get_var(n, "Generator", "p").T)
         )
-        .T.groupby(ggrouper, axis=1)
+        .T.groupby(ggrouper, axis=1, observed=True)
         .apply(join_exprs)
     )
     lhs_spill = (
@@ -224,7 +259,7 @@ def add_EQ_constraints(n, o, scaling=1e-1):
                 get_var(n, "StorageUnit", "spill").T,
             )
         )
-        .T.groupby(sgrouper, axis=1)
+        .T.groupby(sgrouper, axis=1, observed=True)
         .apply(join_exprs)
     )
     lhs_spill = lhs_spill.reindex(lhs_gen.index).fillna("")
@@ -233,37 +268,30 @@ def add_EQ_constraints(n, o, scaling=1e-1):
 
 
 def add_BAU_constraints(n, config):
-    ext_c = n.generators.query("p_nom_extendable").carrier.unique()
+    ext_c = n.generators.carrier[n._ext_i].unique()
     mincaps = pd.Series(
         config["electricity"].get("BAU_mincapacities", {key: 0 for key in ext_c})
     )
-    lhs = (
-        linexpr((1, get_var(n, "Generator", "p_nom")))
-        .groupby(n.generators.carrier)
-        .apply(join_exprs)
-    )
-    define_constraints(n, lhs, ">=", mincaps[lhs.index], "Carrier", "bau_mincaps")
-
     maxcaps = pd.Series(
         config["electricity"].get("BAU_maxcapacities", {key: np.inf for key in ext_c})
     )
+    # the per-carrier capacity expression is identical for both bounds;
+    # the string join in join_exprs is the expensive part, so build it once
     lhs = (
         linexpr((1, get_var(n, "Generator", "p_nom")))
         .groupby(n.generators.carrier)
         .apply(join_exprs)
     )
+    define_constraints(n, lhs, ">=", mincaps[lhs.index], "Carrier", "bau_mincaps")
     define_constraints(n, lhs, "<=", maxcaps[lhs.index], "Carrier", "bau_maxcaps")
 
 
 def add_SAFE_constraints(n, config):
-    peakdemand = (
-        1.0 + config["electricity"]["SAFE_reservemargin"]
-    ) * n.loads_t.p_set.sum(axis=1).max()
+    peakdemand = (1.0 + config["electricity"]["SAFE_reservemargin"]) * n._total_load_max
     conv_techs = config["plotting"]["conv_techs"]
-    exist_conv_caps = n.generators.query(
-        "~p_nom_extendable & carrier in @conv_techs"
-    ).p_nom.sum()
-    ext_gens_i = n.generators.query("carrier in @conv_techs & p_nom_extendable").index
+    conv_i = n.generators.index[n.generators.carrier.isin(conv_techs).values]
+    exist_conv_caps = n.generators.p_nom[conv_i.intersection(n._fix_i)].sum()
+    ext_gens_i = conv_i.intersection(n._ext_i)
     lhs = linexpr((1, get_var(n, "Generator", "p_nom")[ext_gens_i])).sum()
     rhs = peakdemand - exist_conv_caps
     define_constraints(n, lhs, ">=", rhs, "Safe", "mintotalcap")
@@ -279,25 +307,29 @@ def add_operational_reserve_margin_constraint(n, config):
     reserve = get_var(n, "Generator", "r")
     lhs = linexpr((1, reserve)).sum(1)
 
-    # Share of extendable renewable capacities
-    ext_i = n.generators.query("p_nom_extendable").index
-    vres_i = n.generators_t.p_max_pu.columns
-    if not ext_i.empty and not vres_i.empty:
-        capacity_factor = n.generators_t.p_max_pu[vres_i.intersection(ext_i)]
-        renewable_capacity_variables = get_var(n, "Generator", "p_nom")[
-            vres_i.intersection(ext_i)
-        ]
+    # Share of extendable renewable capacities; split the vres columns
+    # into extendable and fixed once instead of repeated Index set-ops
+    p_max_pu = n.generators_t.p_max_pu
+    vres_i = p_max_pu.columns
+    vres_ext_mask = vres_i.isin(n._ext_i)
+    vres_ext_i = vres_i[vres_ext_mask]
+    vres_fix_i = vres_i[~vres_ext_mask]
+    if not vres_ext_i.empty:
+        capacity_factor = p_max_pu[vres_ext_i]
+        renewable_capacity_variables = get_var(n, "Generator", "p_nom")[vres_ext_i]
         lhs += linexpr(
             (-EPSILON_VRES * capacity_factor, renewable_capacity_variables)
         ).sum(1)
 
     # Total demand at t
-    demand = n.loads_t.p.sum(1)
+    demand = n._total_load_t
 
-    # VRES potential of non extendable generators
-    capacity_factor = n.generators_t.p_max_pu[vres_i.difference(ext_i)]
-    renewable_capacity = n.generators.p_nom[vres_i.difference(ext_i)]
-    potential = (capacity_factor * renewable_capacity).sum(1)
+    # VRES potential of non extendable generators, as a single
+    # matrix-vector product on the underlying values
+    potential = pd.Series(
+        p_max_pu.values[:, ~vres_ext_mask] @ n.generators.p_nom[vres_fix_i].values,
+        index=p_max_pu.index,
+    )
 
     # Right-hand-side
     rhs = EPSILON_LOAD * demand + EPSILON_VRES * potential + CONTINGENCY
@@ -307,25 +339,27 @@ def add_operational_reserve_margin_constraint(n, config):
 
 def update_capacity_constraint(n):
     gen_i = n.generators.index
-    ext_i = n.generators.query("p_nom_extendable").index
-    fix_i = n.generators.query("not p_nom_extendable").index
+    ext_i = n._ext_i
+    fix_i = n._fix_i
 
     dispatch = get_var(n, "Generator", "p")
     reserve = get_var(n, "Generator", "r")
 
     capacity_fixed = n.generators.p_nom[fix_i]
 
-    p_max_pu = get_as_dense(n, "Generator", "p_max_pu")
-
     lhs = linexpr((1, dispatch), (1, reserve))
 
     if not ext_i.empty:
+        # materialise the dense p_max_pu only for the extendable columns
+        # rather than expanding the full T x G frame and slicing a copy
+        p_max_pu_ext = get_as_dense(n, "Generator", "p_max_pu", inds=ext_i)
         capacity_variable = get_var(n, "Generator", "p_nom")
-        lhs += linexpr((-p_max_pu[ext_i], capacity_variable)).reindex(
+        lhs += linexpr((-p_max_pu_ext, capacity_variable)).reindex(
             columns=gen_i, fill_value=""
         )
 
-    rhs = (p_max_pu[fix_i] * capacity_fixed).reindex(columns=gen_i, fill_value=0)
+    p_max_pu_fix = get_as_dense(n, "Generator", "p_max_pu", inds=fix_i)
+    rhs = (p_max_pu_fix * capacity_fixed).reindex(columns=gen_i, fill_value=0)
 
     define_constraints(n, lhs, "<=", rhs, "Generators", "updated_capacity_constraint")
 
@@ -359,10 +393,10 @@ def add_battery_constraints(n):
 
 
 def add_RES_constraints(n, res_share):
-    lgrouper = n.loads.bus.map(n.buses.country)
-    ggrouper = n.generators.bus.map(n.buses.country)
-    sgrouper = n.storage_units.bus.map(n.buses.country)
-    cgrouper = n.links.bus0.map(n.buses.country)
+    lgrouper = n._cc_cache["load_country"]
+    ggrouper = n._cc_cache["gen_country"]
+    sgrouper = n._cc_cache["su_country"]
+    cgrouper = n._cc_cache["link0_country"]
 
     logger.warning(
         "The add_RES_constraints functionality is still work in progress. "
@@ -371,9 +405,8 @@ def add_RES_constraints(n, res_share):
         "is subject to the obtimisation."
     )
 
-    load = (
-        n.snapshot_weightings.generators
-        @ n.loads_t.p_set.groupby(lgrouper, axis=1).sum()
+    load = group_weighted_sum(
+        n.loads_t.p_set, lgrouper, n.snapshot_weightings.generators
     )
 
     rhs = res_share * load
@@ -400,7 +433,7 @@ def add_RES_constraints(n, res_share):
         linexpr(
             (n.snapshot_weightings.generators, get_var(n, "Generator", "p")[gens_i].T)
         )
-        .T.groupby(ggrouper, axis=1)
+        .T.groupby(ggrouper, axis=1, observed=True)
         .apply(join_exprs)
     )
 
@@ -413,7 +446,7 @@ def add_RES_constraints(n, res_share):
                     get_var(n, "StorageUnit", "p_dispatch")[stores_i].T,
                 )
             )
-            .T.groupby(sgrouper, axis=1)
+            .T.groupby(sgrouper, axis=1, observed=True)
             .apply(join_exprs)
         )
         .reindex(lhs_gen.index)
@@ -428,7 +461,7 @@ def add_RES_constraints(n, res_share):
                     get_var(n, "StorageUnit", "p_store")[stores_i].T,
                 )
             )
-            .T.groupby(sgrouper, axis=1)
+            .T.groupby(sgrouper, axis=1, observed=True)
             .apply(join_exprs)
         )
         .reindex(lhs_gen.index)
@@ -446,7 +479,7 @@ def add_RES_constraints(n, res_share):
                     get_var(n, "Link", "p")[charger_i].T,
                 )
             )
-            .T.groupby(cgrouper, axis=1)
+            .T.groupby(cgrouper, axis=1, observed=True)
             .apply(join_exprs)
         )
         .reindex(lhs_gen.index)
@@ -457,13 +490,14 @@ def add_RES_constraints(n, res_share):
         (
             linexpr(
                 (
-                    n.snapshot_weightings.stores.apply(
-                        lambda r: r * n.links.loc[discharger_i].efficiency
-                    ),
+                    # outer product of snapshot weightings and efficiencies
+                    # instead of a Python lambda applied per snapshot
+                    n.snapshot_weightings.stores.values[:, None]
+                    * n.links.loc[discharger_i, "efficiency"].values[None, :],
                     get_var(n, "Link", "p")[discharger_i],
                 )
             )
-            .groupby(cgrouper, axis=1)
+            .groupby(cgrouper, axis=1, observed=True)
             .apply(join_exprs)
         )
         .reindex(lhs_gen.index)
@@ -477,6 +511,39 @@ def add_RES_constraints(n, res_share):
     define_constraints(n, lhs, "=", rhs, "RES share")
 
 
+def cache_constraint_data(n):
+    """
+    Precomputes groupers and index splits shared by the constraint builders.
+
+    ``ilopf`` rebuilds the model and re-runs ``extra_functionality`` in every
+    iteration, while neither the bus countries nor the extendability split
+    change in between; compute them once and reuse them across iterations.
+    """
+    if hasattr(n, "_cc_cache"):
+        return
+    # the bus -> country groupers are shared by several constraint builders;
+    # build the hash map over the bus index only once. Categorical dtype
+    # lets the downstream groupbys dispatch on integer codes instead of
+    # hashing country strings on every call
+    bus_country = n.buses["country"].astype("category")
+    country_dtype = bus_country.dtype
+    n._cc_cache = {
+        "gen_country": n.generators.bus.map(bus_country).astype(country_dtype),
+        "load_country": n.loads.bus.map(bus_country).astype(country_dtype),
+        "su_country": n.storage_units.bus.map(bus_country).astype(country_dtype),
+        "link0_country": n.links.bus0.map(bus_country).astype(country_dtype),
+    }
+    # likewise, the extendable/fixed generator split is needed by most
+    # builders; a boolean mask avoids repeated pandas .query() scans
+    ext_mask = n.generators.p_nom_extendable.values
+    n._ext_i = n.generators.index[ext_mask]
+    n._fix_i = n.generators.index[~ext_mask]
+    # total load time series, shared by the SAFE and operational reserve
+    # margin constraints; one T x L reduction instead of one per builder
+    n._total_load_t = n.loads_t.p_set.sum(axis=1)
+    n._total_load_max = n._total_load_t.values.max()
+
+
 def extra_functionality(n, snapshots):
     """
     Collects supplementary constraints which will be passed to
@@ -487,11 +554,13 @@ def extra_functionality(n, snapshots):
     """
     opts = n.opts
     config = n.config
-    if "BAU" in opts and n.generators.p_nom_extendable.any():
+    cache_constraint_data(n)
+    has_ext_gens = not n._ext_i.empty
+    if "BAU" in opts and has_ext_gens:
         add_BAU_constraints(n, config)
-    if "SAFE" in opts and n.generators.p_nom_extendable.any():
+    if "SAFE" in opts and has_ext_gens:
         add_SAFE_constraints(n, config)
-    if "CCL" in opts and n.generators.p_nom_extendable.any():
+    if "CCL" in opts and has_ext_gens:
         add_CCL_constraints(n, config)
     reserve = config["electricity"].get("operational_reserve", {})
     if reserve.get("activate"):